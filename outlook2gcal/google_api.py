@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 from urllib3.exceptions import NewConnectionError, MaxRetryError
 
 import arrow
@@ -40,14 +41,30 @@ class GoogleCalendarApiClient(_GoogleApiClient):
     service_type = 'calendar'
     service_version = 'v3'
 
+    @staticmethod
+    def get_event_id(ews_id):
+        """
+        Derive a stable Google event ID from an Exchange event ID.
+
+        Google event IDs may only use the characters allowed in base32hex
+        encoding (lowercase a-v and 0-9), which a hexadecimal digest satisfies.
+
+        Args:
+            ews_id (str): ID in Exchange for the event
+
+        Returns:
+            str: Google ID for the event
+        """
+        return hashlib.sha256(ews_id.encode('utf-8')).hexdigest()
+
     def get_events(self, calendar_id, time_min=None, time_max=None):
         """
         Get all events for a given calendar.
 
         Args:
             calendar_id (str): Google Calendar ID to query
-            time_min (datetime.datetime, None): Earliest event time
-            time_max (datetime.datetime, None): Latest event time
+            time_min (str, None): Earliest event time, RFC3339 formatted
+            time_max (str, None): Latest event time, RFC3339 formatted
 
         Returns:
              list[dict]: Events from the calendar
@@ -90,6 +107,10 @@ class GoogleCalendarApiClient(_GoogleApiClient):
         """
         Create an event on a given calendar.
 
+        When an Exchange ID is given, the Google event ID is derived from it so
+        that repeated creates of the same event are idempotent. If the event
+        already exists, it is updated instead.
+
         Args:
             calendar_id (str): Google Calendar ID to query
             name (str): Event name
@@ -125,6 +146,9 @@ class GoogleCalendarApiClient(_GoogleApiClient):
             }
         }
 
+        if ews_id:
+            event['id'] = self.get_event_id(ews_id)
+
         if recurrence:
             event['recurrence'] = recurrence
 
@@ -134,6 +158,12 @@ class GoogleCalendarApiClient(_GoogleApiClient):
                 body=event
             ).execute()
         except HttpError as exc:
+            if ews_id and exc.resp.status == 409:
+                return self.update_event(
+                    event['id'], calendar_id, name, location, body, start,
+                    end, ews_id=ews_id, change_key=change_key,
+                    recurrence=recurrence
+                )
             print('Google HTTP Error')
             print(exc.__class__.__name__)
             print(format_exceptions_errors(exc))
@@ -190,7 +220,7 @@ class GoogleCalendarApiClient(_GoogleApiClient):
             return self.service.events().update(
                 calendarId=calendar_id,
                 eventId=event_id,
-                body=body
+                body=event
             ).execute()
         except HttpError as exc:
             print('Google HTTP Error')
@@ -1,17 +1,23 @@
 from time import sleep
 
 import arrow
-from exchangelib import UTC_NOW, UTC, EWSDateTime
+from exchangelib import UTC, EWSDateTime
 from tzlocal.windows_tz import win_tz
 
 from .exchange_api import ExchangeApiClient
 from .google_api import GoogleCalendarApiClient
 
 
+DEFAULT_HORIZON_PAST_DAYS = 0
+DEFAULT_HORIZON_FUTURE_DAYS = 90
+
+
 class SyncRunner:
     """Class for tying together code related to synchronization"""
 
-    def __init__(self, gcal_creds, email, password, server, calendar_id):
+    def __init__(self, gcal_creds, email, password, server, calendar_id,
+                 horizon_past_days=DEFAULT_HORIZON_PAST_DAYS,
+                 horizon_future_days=DEFAULT_HORIZON_FUTURE_DAYS):
         """
         Initialize the synchronization class.
 
@@ -23,33 +29,78 @@ class SyncRunner:
             server (str): Server for the Microsoft Exchange account
             calendar_id (str): Google Calendar ID for the calendar to which
                 the events will be synchronized
+            horizon_past_days (int): Number of days before the current time
+                from which events are synchronized
+            horizon_future_days (int): Number of days after the current time
+                up to which events are synchronized
+
+        Raises:
+            ValueError: If either horizon is negative
         """
+        if horizon_past_days < 0 or horizon_future_days < 0:
+            raise ValueError('Sync horizons must not be negative')
+
         self.exchange = ExchangeApiClient(email, password, server)
         self.google = GoogleCalendarApiClient(
             gcal_creds,
             scopes='https://www.googleapis.com/auth/calendar'
         )
         self.calendar_id = calendar_id
+        self.horizon_past_days = horizon_past_days
+        self.horizon_future_days = horizon_future_days
 
-    def _get_exchange_events(self, sync_all=False):
+    def _get_sync_window(self, sync_all=False):
         """
-        Getter for events from the Exchange mailbox. Filters for events
-        after the current time.
+        Compute the time window for a synchronization cycle. The same window
+        bounds both the Exchange query and the Google Calendar listing, so
+        every Exchange event in the window can be matched against Google.
+
+        Events that move out of the window are left untouched in Google; they
+        are neither updated nor deleted once they fall outside of it.
+
+        Args:
+            sync_all (bool): Whether to extend the start of the window back to
+                the epoch
+
+        Returns:
+            tuple[arrow.arrow.Arrow]: UTC start and end of the window
         """
-        start = UTC_NOW()
+        now = arrow.utcnow()
+        start = now.shift(days=-self.horizon_past_days)
+        end = now.shift(days=+self.horizon_future_days)
         if sync_all:
-            start = EWSDateTime(day=1, month=1, year=1970, tzinfo=UTC)
+            start = arrow.get(0)
+        return start, end
+
+    def _get_exchange_events(self, start, end):
+        """
+        Getter for events from the Exchange mailbox. Filters for events
+        overlapping the given window, matching the Google Calendar listing
+        semantics (ending after the start and starting before the end).
 
+        Args:
+            start (arrow.arrow.Arrow): UTC start of the window
+            end (arrow.arrow.Arrow): UTC end of the window
+        """
         return self.exchange.get_events().filter(
-            start__gte=start
+            end__gt=UTC.localize(EWSDateTime.from_datetime(start.naive)),
+            start__lt=UTC.localize(EWSDateTime.from_datetime(end.naive))
         ).order_by('start')
 
-    def _get_google_events(self):
+    def _get_google_events(self, start, end):
         """
         Getter for events from the Google calendar. This is for comparing
         existing events in Google in order to compare and deduplicate
+
+        Args:
+            start (arrow.arrow.Arrow): UTC start of the window
+            end (arrow.arrow.Arrow): UTC end of the window
         """
-        return self.google.get_events(self.calendar_id)
+        return self.google.get_events(
+            self.calendar_id,
+            time_min=start.isoformat(),
+            time_max=end.isoformat()
+        )
 
     @staticmethod
     def _event_is_ews_event(event):
@@ -116,7 +167,8 @@ class SyncRunner:
           * Lookups of whether or not Exchange events exist in Google Calendar
               as referenced by EWS ID
           * Lookups of Google event IDs so that existing events that need
-              updates perform the update on the existing event
+              updates perform the update on the existing event. Instances of
+              recurring events resolve to the ID of the recurring event
 
         Args:
             events (list[dict]): List of Google Calendar events
@@ -132,7 +184,7 @@ class SyncRunner:
                     'ewsChangeKey': (
                         event['extendedProperties']['private']['ewsChangeKey']
                     ),
-                    'googleEventId': event['id']
+                    'googleEventId': event.get('recurringEventId', event['id'])
                 }
         return event_dict
 
@@ -159,12 +211,19 @@ class SyncRunner:
             'recurrence': self._get_recurrence(event),
         }
 
-    def sync_events(self):
+    def sync_events(self, sync_all=False):
         """
         Perform synchronization of the Exchange events to the Google Calendar
+
+        Args:
+            sync_all (bool): Whether to synchronize all past events rather
+                than only those within the configured past horizon
         """
-        events = self._get_exchange_events()
-        event_attrs = self.get_event_attrs(self._get_google_events())
+        start, end = self._get_sync_window(sync_all)
+        events = self._get_exchange_events(start, end)
+        event_attrs = self.get_event_attrs(
+            self._get_google_events(start, end)
+        )
 
         for event in events:
             if event.id not in event_attrs:
@@ -181,7 +240,9 @@ class SyncRunner:
             sleep(0.1)
 
     @classmethod
-    def sync(cls, gcal_creds, email, password, server, calendar_id):
+    def sync(cls, gcal_creds, email, password, server, calendar_id,
+             horizon_past_days=DEFAULT_HORIZON_PAST_DAYS,
+             horizon_future_days=DEFAULT_HORIZON_FUTURE_DAYS):
         """
         Class method for initiating a synchronization of an Exchange calendar
         to a Google Calendar
@@ -194,6 +255,14 @@ class SyncRunner:
             server (str): Server for the Microsoft Exchange account
             calendar_id (str): Google Calendar ID for the calendar to which
                 the events will be synchronized
+            horizon_past_days (int): Number of days before the current time
+                from which events are synchronized
+            horizon_future_days (int): Number of days after the current time
+                up to which events are synchronized
         """
-        klass = cls(gcal_creds, email, password, server, calendar_id)
+        klass = cls(
+            gcal_creds, email, password, server, calendar_id,
+            horizon_past_days=horizon_past_days,
+            horizon_future_days=horizon_future_days
+        )
         klass.sync_events()
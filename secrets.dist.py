@@ -5,6 +5,8 @@ EXCHANGE_ACCOUNTS = [
         "emailAddress": "",
         "password": "",
         "server": "",
-        "googleCalendarId": ""
+        "googleCalendarId": "",
+        "syncHorizonPastDays": 0,
+        "syncHorizonFutureDays": 90
     },
 ]
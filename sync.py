@@ -1,6 +1,8 @@
 from time import sleep
 
-from outlook2gcal.sync_component import SyncRunner
+from outlook2gcal.sync_component import (
+    DEFAULT_HORIZON_FUTURE_DAYS, DEFAULT_HORIZON_PAST_DAYS, SyncRunner
+)
 
 import secrets
 
@@ -16,7 +18,13 @@ if __name__ == '__main__':
                 exchange_acct['emailAddress'],
                 exchange_acct['password'],
                 exchange_acct['server'],
-                exchange_acct['googleCalendarId']
+                exchange_acct['googleCalendarId'],
+                horizon_past_days=exchange_acct.get(
+                    'syncHorizonPastDays', DEFAULT_HORIZON_PAST_DAYS
+                ),
+                horizon_future_days=exchange_acct.get(
+                    'syncHorizonFutureDays', DEFAULT_HORIZON_FUTURE_DAYS
+                )
             )
         sleep(1800)
 
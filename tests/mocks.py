@@ -1,3 +1,6 @@
+from googleapiclient.errors import HttpError
+from httplib2 import Response
+
 from .providers import random_exchange_event, random_gcal_event
 
 
@@ -71,20 +74,25 @@ class GenericExecuteInterface:
 
 class EventInterface:
 
-    _events = []
+    def __init__(self):
+        self._events = []
 
     def list(self, *args, **kwargs):
         return GenericExecuteInterface(self._events)
 
     def insert(self, calendarId, body):
-        self._events.append(
-            random_gcal_event(
-                ewsId=body['extendedProperties']['private']['ewsId'],
-                ewsChangeKey=(
-                    body['extendedProperties']['private']['ewsChangeKey']
-                )
+        if any(event['id'] == body.get('id') for event in self._events):
+            raise HttpError(Response({'status': 409}), b'Conflict')
+
+        event = random_gcal_event(
+            ewsId=body['extendedProperties']['private']['ewsId'],
+            ewsChangeKey=(
+                body['extendedProperties']['private']['ewsChangeKey']
             )
         )
+        if body.get('id'):
+            event['id'] = body['id']
+        self._events.append(event)
         return GenericExecuteInterface()
 
     def update(self, eventId, calendarId, body):
@@ -1,11 +1,14 @@
 import json
 
 import pytest
+from googleapiclient.errors import HttpError
+from httplib2 import Response
 
 from outlook2gcal.sync_component import SyncRunner
 
 from .mocks import (
-    MockAccount, MockConfiguration, MockServiceAccountCredentials, mock_build,
+    MockAccount, MockCalendarFilteredEventList, MockConfiguration,
+    MockServiceAccountCredentials, mock_build, random_exchange_event,
     random_gcal_event
 )
 
@@ -55,3 +58,131 @@ def test_sync_events_all_new(faker, sync_mocks):
     runner.sync_events()
 
     assert len(runner.google.service._events._events) == 3
+
+
+def test_sync_window_bounds_both_sides(faker, mocker, sync_mocks):
+    runner = SyncRunner(
+        sync_mocks, faker.email(), faker.pystr(), 'www.example.com', '12345',
+        horizon_past_days=7, horizon_future_days=60
+    )
+    start, end = runner._get_sync_window()
+    assert (end - start).days == 67
+
+    exchange_filter = mocker.spy(
+        runner.exchange.get_events().__class__, 'filter'
+    )
+    google_list = mocker.spy(runner.google.service.events(), 'list')
+
+    runner._get_exchange_events(start, end)
+    runner._get_google_events(start, end)
+
+    exchange_kwargs = exchange_filter.call_args[1]
+    assert exchange_kwargs['end__gt'].isoformat() == start.isoformat()
+    assert exchange_kwargs['start__lt'].isoformat() == end.isoformat()
+
+    google_kwargs = google_list.call_args[1]
+    assert google_kwargs['timeMin'] == start.isoformat()
+    assert google_kwargs['timeMax'] == end.isoformat()
+
+
+def test_sync_window_rejects_negative_horizon(faker, sync_mocks):
+    with pytest.raises(ValueError):
+        SyncRunner(
+            sync_mocks, faker.email(), faker.pystr(), 'www.example.com',
+            '12345', horizon_future_days=-1
+        )
+
+
+def test_create_event_is_idempotent(faker, sync_mocks):
+    runner = SyncRunner(
+        sync_mocks, faker.email(), faker.pystr(), 'www.example.com', '12345'
+    )
+    events = runner.google.service._events._events
+    event = random_exchange_event()
+    props = runner._format_event_props(event)
+
+    runner.google.create_event(runner.calendar_id, **props)
+    count = len(events)
+
+    props['change_key'] = faker.pystr(min_chars=None, max_chars=20)
+    runner.google.create_event(runner.calendar_id, **props)
+
+    assert len(events) == count
+    created = [
+        _ for _ in events
+        if _['id'] == runner.google.get_event_id(event.id)
+    ]
+    assert len(created) == 1
+    assert (
+        created[0]['extendedProperties']['private']['ewsChangeKey'] ==
+        props['change_key']
+    )
+
+
+def test_sync_events_updates_recurring_event(faker, mocker, sync_mocks):
+    runner = SyncRunner(
+        sync_mocks, faker.email(), faker.pystr(), 'www.example.com', '12345'
+    )
+    exchange_event = MockCalendarFilteredEventList._ordered_event_list[0]
+    recurring_id = runner.google.get_event_id(exchange_event.id)
+
+    instance = random_gcal_event(
+        ewsId=exchange_event.id, ewsChangeKey=faker.pystr()
+    )
+    instance['id'] = f'{recurring_id}_20261020T150000Z'
+    instance['recurringEventId'] = recurring_id
+
+    mocker.patch.object(runner, '_get_google_events', return_value=[instance])
+    mocker.patch.object(runner.google, 'create_event')
+    update_event = mocker.patch.object(runner.google, 'update_event')
+
+    runner.sync_events()
+
+    assert update_event.call_count == 1
+    assert update_event.call_args[0][0] == recurring_id
+
+
+def test_sync_events_converts_conflict_to_update(faker, mocker, sync_mocks):
+    runner = SyncRunner(
+        sync_mocks, faker.email(), faker.pystr(), 'www.example.com', '12345'
+    )
+    events = runner.google.service._events._events
+    exchange_event = MockCalendarFilteredEventList._ordered_event_list[0]
+
+    existing = random_gcal_event(
+        ewsId=exchange_event.id, ewsChangeKey=faker.pystr()
+    )
+    existing['id'] = runner.google.get_event_id(exchange_event.id)
+    events.append(existing)
+
+    mocker.patch.object(runner, '_get_google_events', return_value=[])
+    update_event = mocker.spy(runner.google, 'update_event')
+
+    runner.sync_events()
+
+    assert len(events) == 3
+    assert update_event.call_count == 1
+    assert (
+        existing['extendedProperties']['private']['ewsChangeKey'] ==
+        exchange_event.changekey
+    )
+
+
+@pytest.mark.parametrize('status, with_ews_id', [(400, True), (409, False)])
+def test_create_event_error_is_not_update(faker, mocker, sync_mocks, status,
+                                          with_ews_id):
+    runner = SyncRunner(
+        sync_mocks, faker.email(), faker.pystr(), 'www.example.com', '12345'
+    )
+    props = runner._format_event_props(random_exchange_event())
+    if not with_ews_id:
+        props['ews_id'] = None
+
+    mocker.patch.object(
+        runner.google.service.events(), 'insert',
+        side_effect=HttpError(Response({'status': status}), b'Error')
+    )
+    update_event = mocker.spy(runner.google, 'update_event')
+
+    assert runner.google.create_event(runner.calendar_id, **props) is None
+    assert update_event.call_count == 0